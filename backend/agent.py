@@ -105,6 +105,11 @@ objectives, while Snapchat appears to be primarily driving traffic without conve
 - Input: "conversion" or "traffic"
 - **Reasoning to share**: How objectives impact channel performance
 
+**ChannelTrends**
+- When: User asks whether a channel is improving, declining, or how it changed month over month
+- Input: "source: snapchat, product: corolla, metric: cost_per_lead" (all parts optional; no product = channel total)
+- **Reasoning to share**: Direction of MoM changes and how the latest month compares to the moving average
+
 ### For Media Plans, use:
 
 **SubmitUserInputs**
@@ -1,7 +1,8 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, HTTPException
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from backend.agent import chat_with_agent
+from backend.media_tools import trend_engine
 
 app = FastAPI()
 
@@ -23,4 +24,17 @@ def read_root():
 @app.post("/chat")
 def chat(request: ChatRequest):
     response = chat_with_agent(request.prompt)
-    return {"response": response}
\ No newline at end of file
+    return {"response": response}
+
+@app.get("/trends")
+def trends(source: str = None, product: str = None, metric: str = None):
+    try:
+        result = trend_engine.get_trends(source, product, metric)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    result = result.astype(object).where(result.notna(), None)
+    return {"trends": result.to_dict(orient="records")}
@@ -1,9 +1,14 @@
 from langchain.agents import Tool
 from backend.dataset_loader import load_dataset
 from backend.logic import (get_top_channels_by_kpi, filter_by_objective, summarize_channel_performance, suggest_spend_split, submit_user_inputs, get_current_inputs)
+from backend.trends import MonthlyTrendEngine
+import re
 
 df = load_dataset()
 
+trend_engine = MonthlyTrendEngine()
+trend_engine.update(df)
+
 top_channels_tool = Tool(
     name="TopChannelsByKPI",
     func=lambda kpi: get_top_channels_by_kpi(df, kpi).to_string(index=False),
@@ -46,6 +51,29 @@ def _parse_and_suggest_split(input: str) -> str:
     except Exception as e:
         return f"Invalid input. Please use format like '10000 leads'. Error: {str(e)}"
 
+channel_trends_tool = Tool(
+    name="ChannelTrends",
+    func=lambda input: _parse_and_get_trends(input),
+    description=(
+        "Shows month-over-month trends (value, MoM % change, 3-month moving average) of spends, leads, "
+        "ad_clicks, cost_per_lead and cost_per_click per channel. "
+        "Input format: 'source: snapchat, product: corolla, metric: cost_per_lead' (all optional)."
+    )
+)
+
+def _parse_and_get_trends(input: str) -> str:
+    try:
+        text = (input or "").strip().strip("'\"").lower()
+        filters = {}
+        for key in ("source", "product", "metric"):
+            match = re.search(rf"{key}\s*:\s*([^,]+)", text)
+            filters[key] = match.group(1).strip().strip("'\"").strip() if match else None
+        if text and not any(filters.values()):
+            raise ValueError(f"No 'source:', 'product:' or 'metric:' filter found in '{input}'")
+        return trend_engine.get_trends(**filters).to_string(index=False)
+    except Exception as e:
+        return f"Invalid input. Please use format like 'source: snapchat, metric: cost_per_click'. Error: {str(e)}"
+
 def collect_user_input(prompt: str) -> str:
     return (
         "Before I proceed, I need a few details:\n"
@@ -80,6 +108,7 @@ tools_list = [
     filter_objective_tool,
     channel_summary_tool,
     budget_split_tool,
+    channel_trends_tool,
     submit_user_inputs_tool,
     collect_user_input_tool,
     get_inputs_tool
@@ -0,0 +1,151 @@
+import pandas as pd
+
+TREND_METRICS = ["spends", "leads", "ad_clicks", "cost_per_lead", "cost_per_click"]
+ALL_PRODUCTS = "All"
+SERIES_KEYS = ["source", "product"]
+RAW_METRICS = ["spends", "leads", "ad_clicks"]
+
+
+class MonthlyTrendEngine:
+    """
+    Keeps rolling month-over-month series of spend, leads, clicks, CPL and CPC
+    per source/product (plus a per-source total under product "All").
+    update() ingests new or corrected months; rows for a source/product/month
+    that is already stored are replaced by the incoming values (latest batch wins).
+    Only series touched by a batch are recomputed, from their earliest changed month on.
+    """
+
+    def __init__(self, window: int = 3):
+        if window < 1:
+            raise ValueError(f"Moving average window must be at least 1, got {window}.")
+        self.window = window
+        self.series = pd.DataFrame()
+
+    def update(self, df: pd.DataFrame) -> int:
+        """
+        Ingest monthly rows and return how many stored rows were added or changed,
+        including regenerated per-source "All" totals (a one-row correction returns 2).
+        """
+        stored = self.series
+        products = stored[stored["product"] != ALL_PRODUCTS] if not stored.empty else stored
+
+        changed = _changed_rows(_aggregate_monthly(df), products)
+        if changed.empty:
+            return 0
+
+        # Per-source totals are rebuilt from the stored product rows for every
+        # source/month the batch touches, so late product rows are reflected.
+        raw = pd.concat([products[SERIES_KEYS + ["period"] + RAW_METRICS], changed] if not products.empty else [changed])
+        raw = raw.drop_duplicates(SERIES_KEYS + ["period"], keep="last")
+        touched = changed[["source", "period"]].drop_duplicates()
+        totals = raw.merge(touched).drop(columns="product").groupby(["source", "period"], as_index=False).sum()
+        totals["product"] = ALL_PRODUCTS
+        changed = pd.concat([changed, _changed_rows(totals, stored)], ignore_index=True)
+
+        combined = pd.concat([stored.assign(_changed=False), changed.assign(_changed=True)], ignore_index=True)
+        combined = combined.drop_duplicates(SERIES_KEYS + ["period"], keep="last")
+        combined = combined.sort_values(SERIES_KEYS + ["period"], ignore_index=True)
+
+        # A changed month shifts the MoM and moving average of every later month in
+        # its series, so everything from the first changed month onward is recomputed,
+        # with enough earlier months pulled in as context for the moving average
+        # (`window - 1`) and MoM (always the previous month).
+        position = combined.groupby(SERIES_KEYS).cumcount()
+        first_changed = position.where(combined["_changed"]).groupby(
+            [combined[k] for k in SERIES_KEYS]).transform("min")
+        context = max(self.window - 1, 1)
+        scope = _derive_trends(combined[position >= first_changed - context], self.window)
+
+        recompute = scope.index[position[scope.index] >= first_changed[scope.index]]
+        combined = combined.reindex(columns=combined.columns.union(scope.columns, sort=False))
+        combined.loc[recompute, scope.columns] = scope.loc[recompute]
+
+        self.series = combined.drop(columns="_changed")
+        return len(changed)
+
+    def get_trends(self, source: str = None, product: str = None, metric: str = None) -> pd.DataFrame:
+        """
+        Return a compact trend table.
+        source/product filter the series (product defaults to the per-source total),
+        metric limits the output to one of TREND_METRICS.
+        Raises LookupError for an unknown source/product and ValueError for an unsupported metric.
+        """
+        if self.series.empty:
+            raise RuntimeError("No monthly data has been loaded yet.")
+
+        result = self.series
+        if source:
+            result = result[result["source"].str.lower() == source.lower()]
+            if result.empty:
+                raise LookupError(f"Source '{source}' not found. Available sources: {self.series['source'].unique()}")
+
+        product = product or ALL_PRODUCTS
+        result = result[result["product"].str.lower() == product.lower()]
+        if result.empty:
+            raise LookupError(f"Product '{product}' not found. Available products: {self.series['product'].unique()}")
+
+        if metric:
+            if metric.lower() not in TREND_METRICS:
+                raise ValueError(f"Metric '{metric}' not supported. Use one of: {', '.join(TREND_METRICS)}")
+            metrics = [metric.lower()]
+        else:
+            metrics = TREND_METRICS
+
+        columns = [col for m in metrics for col in (m, f"{m}_mom_pct", f"{m}_ma")]
+        result = result[SERIES_KEYS + ["period"] + columns].rename(columns={"period": "month"})
+        result = result.assign(month=result["month"].dt.strftime("%b %Y")).round(2)
+        return result.reset_index(drop=True)
+
+
+def _aggregate_monthly(df: pd.DataFrame) -> pd.DataFrame:
+    """Sum raw spend/leads/clicks per source, product and calendar month."""
+    period = pd.to_datetime(
+        df["year"].astype(str) + "-" + df["month"].str.strip(), format="%Y-%B"
+    ).dt.to_period("M")
+    raw = df.assign(period=period)[SERIES_KEYS + ["period"] + RAW_METRICS]
+    return raw.groupby(SERIES_KEYS + ["period"], as_index=False).sum()
+
+
+def _changed_rows(incoming: pd.DataFrame, stored: pd.DataFrame) -> pd.DataFrame:
+    """Return incoming rows that are not stored yet or whose raw values differ."""
+    if stored.empty:
+        return incoming
+    merged = incoming.merge(stored[SERIES_KEYS + ["period"] + RAW_METRICS],
+                            on=SERIES_KEYS + ["period"], how="left", suffixes=("", "_stored"))
+    differs = pd.concat([merged[m] != merged[f"{m}_stored"] for m in RAW_METRICS], axis=1).any(axis=1)
+    return merged.loc[differs, SERIES_KEYS + ["period"] + RAW_METRICS].reset_index(drop=True)
+
+
+def _derive_trends(scope: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    Compute CPL/CPC, MoM % change and a `window`-month moving average.
+    Both are based on calendar months: MoM is NaN when the previous month is
+    missing, and the average only covers rows within the last `window` months.
+    """
+    scope = scope.copy()
+    scope["cost_per_lead"] = scope["spends"] / scope["leads"].where(scope["leads"] > 0)
+    scope["cost_per_click"] = scope["spends"] / scope["ad_clicks"].where(scope["ad_clicks"] > 0)
+
+    month_number = _month_number(scope["period"])
+    grouped = scope.groupby(SERIES_KEYS)
+    values = scope[TREND_METRICS].astype(float)
+
+    previous = grouped[TREND_METRICS].shift(1).astype(float)
+    previous.loc[(month_number - grouped["period"].shift(1).pipe(_month_number)) != 1] = float("nan")
+    mom = (values / previous.where(previous != 0) - 1) * 100
+
+    in_window = [values]
+    for lag in range(1, window):
+        lagged = grouped[TREND_METRICS].shift(lag).astype(float)
+        lagged.loc[(month_number - grouped["period"].shift(lag).pipe(_month_number)) >= window] = float("nan")
+        in_window.append(lagged)
+    moving_avg = pd.concat(in_window).groupby(level=0).mean()
+
+    for metric in TREND_METRICS:
+        scope[f"{metric}_mom_pct"] = mom[metric]
+        scope[f"{metric}_ma"] = moving_avg[metric]
+    return scope.drop(columns="_changed", errors="ignore")
+
+
+def _month_number(period: pd.Series) -> pd.Series:
+    return period.dt.year * 12 + period.dt.month
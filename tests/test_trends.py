@@ -0,0 +1,121 @@
+import math
+import os
+
+import pandas as pd
+import pytest
+
+from backend.trends import MonthlyTrendEngine
+
+
+def _rows(*rows):
+    return pd.DataFrame(
+        rows, columns=["year", "month", "product", "source", "spends", "leads", "ad_clicks"])
+
+
+DATA = _rows(
+    (2024, "October", "Corolla", "Meta", 100.0, 10, 200),
+    (2024, "October", "Yaris", "Meta", 50.0, 5, 100),
+    (2024, "November", "Corolla", "Meta", 120.0, 12, 240),
+    (2024, "November", "Yaris", "Meta", 40.0, 8, 80),
+    (2024, "December", "Corolla", "Meta", 90.0, 9, 300),
+    (2024, "December", "Yaris", "Meta", 60.0, 6, 150),
+    (2024, "December", "Urban Cruiser", "Meta", 30.0, 3, 60),
+    (2024, "October", "Corolla", "Snapchat", 80.0, 0, 400),
+    (2024, "December", "Corolla", "Snapchat", 70.0, 0, 350),
+)
+
+
+def _build(*batches, window=3):
+    engine = MonthlyTrendEngine(window=window)
+    for batch in batches:
+        engine.update(batch)
+    return engine.series.sort_values(["source", "product", "period"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("window", [1, 3])
+@pytest.mark.parametrize("first", [
+    DATA[DATA["month"] == "October"],
+    DATA[DATA["month"] != "November"],
+    DATA[~((DATA["product"] == "Yaris") & (DATA["month"] == "December"))],
+])
+def test_incremental_update_matches_one_shot_build(first, window):
+    expected = _build(DATA, window=window)
+    result = _build(first, DATA, window=window)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+
+def test_update_skips_unchanged_rows_and_replaces_corrected_ones():
+    engine = MonthlyTrendEngine()
+    engine.update(DATA)
+    assert engine.update(DATA) == 0
+
+    corrected = DATA.copy()
+    corrected.loc[0, "spends"] = 130.0
+    assert engine.update(corrected) == 2
+
+    total = engine.get_trends("meta", metric="spends")
+    assert total["spends"].tolist() == [180.0, 160.0, 180.0]
+
+
+def test_month_gap_is_not_treated_as_consecutive():
+    engine = MonthlyTrendEngine(window=2)
+    engine.update(DATA)
+
+    trends = engine.get_trends("snapchat", "corolla", "spends")
+    assert trends["month"].tolist() == ["Oct 2024", "Dec 2024"]
+    assert math.isnan(trends["spends_mom_pct"].iloc[1])
+    assert trends["spends_ma"].iloc[1] == 70.0
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        MonthlyTrendEngine(window=0)
+
+
+def test_get_trends_error_paths():
+    engine = MonthlyTrendEngine()
+    with pytest.raises(RuntimeError):
+        engine.get_trends()
+
+    engine.update(DATA)
+    with pytest.raises(LookupError):
+        engine.get_trends("tiktok")
+    with pytest.raises(LookupError):
+        engine.get_trends("meta", "camry")
+    with pytest.raises(ValueError):
+        engine.get_trends("meta", metric="impressions")
+
+
+@pytest.fixture
+def engine():
+    engine = MonthlyTrendEngine()
+    engine.update(DATA)
+    return engine
+
+
+def test_trends_tool_parses_multi_word_and_quoted_values(engine, monkeypatch):
+    media_tools = pytest.importorskip("backend.media_tools")
+    monkeypatch.setattr(media_tools, "trend_engine", engine)
+
+    output = media_tools._parse_and_get_trends("source: meta, product: urban cruiser, metric: cost_per_lead")
+    assert "Urban Cruiser" in output and "cost_per_lead_mom_pct" in output
+
+    output = media_tools._parse_and_get_trends('"source: snapchat"')
+    assert "Snapchat" in output and "Meta" not in output
+
+    assert media_tools._parse_and_get_trends("snapchat").startswith("Invalid input")
+
+
+def test_trends_endpoint_status_codes(engine, monkeypatch):
+    testclient = pytest.importorskip("fastapi.testclient")
+    # backend.main builds the LLM client at import time, which needs a key to exist.
+    if not os.getenv("GOOGLE_API_KEY"):
+        monkeypatch.setenv("GOOGLE_API_KEY", "test")
+    main = pytest.importorskip("backend.main")
+    monkeypatch.setattr(main, "trend_engine", engine)
+    client = testclient.TestClient(main.app)
+
+    assert client.get("/trends", params={"source": "meta"}).status_code == 200
+    assert client.get("/trends", params={"source": "tiktok"}).status_code == 404
+    assert client.get("/trends", params={"product": "camry"}).status_code == 404
+    assert client.get("/trends", params={"metric": "impressions"}).status_code == 400